@@ -3,16 +3,31 @@ Database configuration and connection management
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 from dotenv import load_dotenv
 
-load_dotenv()
 
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'port': os.getenv('DB_PORT', '5432'),
-    'database': os.getenv('DB_NAME', 'healthai_coach'),
-    'user': os.getenv('DB_USER', ''),
-    'password': os.getenv('DB_PASSWORD', '')
-}
+@lru_cache(maxsize=1)
+def get_db_config() -> Mapping[str, str]:
+    """
+    Load .env and read database settings once per process
+
+    Returns:
+        Read-only mapping of connection parameters
+    """
+    load_dotenv()
+
+    return MappingProxyType({
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': os.getenv('DB_PORT', '5432'),
+        'database': os.getenv('DB_NAME', 'healthai_coach'),
+        'user': os.getenv('DB_USER', ''),
+        'password': os.getenv('DB_PASSWORD', '')
+    })
+
+
+DB_CONFIG = get_db_config()
 
 DATABASE_URL = f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
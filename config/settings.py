@@ -3,23 +3,63 @@ Global settings and configuration
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Union
 from dotenv import load_dotenv
 
-load_dotenv()
 
-BASE_DIR = Path(__file__).resolve().parent.parent
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the environment configuration"""
+    base_dir: Path
+    raw_data_dir: Path
+    processed_data_dir: Path
+    logs_dir: Path
+    scraping_config: Mapping[str, Union[str, int]]
+    log_level: str
+    log_file: Path
 
-RAW_DATA_DIR = BASE_DIR / os.getenv('RAW_DATA_PATH', 'data/raw')
-PROCESSED_DATA_DIR = BASE_DIR / os.getenv('PROCESSED_DATA_PATH', 'data/processed')
-LOGS_DIR = BASE_DIR / 'data' / 'logs'
 
-SCRAPING_CONFIG = {
-    'user_agent': os.getenv('USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'),
-    'request_delay': int(os.getenv('REQUEST_DELAY', 1)),
-    'max_retries': int(os.getenv('MAX_RETRIES', 3)),
-    'timeout': int(os.getenv('TIMEOUT', 30))
-}
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load .env and read configuration once per process
 
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE = BASE_DIR / os.getenv('LOG_FILE', 'data/logs/etl.log')
+    Returns:
+        Frozen Settings instance
+    """
+    load_dotenv()
+
+    base_dir = Path(__file__).resolve().parent.parent
+
+    return Settings(
+        base_dir=base_dir,
+        raw_data_dir=base_dir / os.getenv('RAW_DATA_PATH', 'data/raw'),
+        processed_data_dir=base_dir / os.getenv('PROCESSED_DATA_PATH', 'data/processed'),
+        logs_dir=base_dir / 'data' / 'logs',
+        scraping_config=MappingProxyType({
+            'user_agent': os.getenv('USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'),
+            'request_delay': int(os.getenv('REQUEST_DELAY', 1)),
+            'max_retries': int(os.getenv('MAX_RETRIES', 3)),
+            'timeout': int(os.getenv('TIMEOUT', 30))
+        }),
+        log_level=os.getenv('LOG_LEVEL', 'INFO'),
+        log_file=base_dir / os.getenv('LOG_FILE', 'data/logs/etl.log')
+    )
+
+
+_settings = get_settings()
+
+BASE_DIR = _settings.base_dir
+
+RAW_DATA_DIR = _settings.raw_data_dir
+PROCESSED_DATA_DIR = _settings.processed_data_dir
+LOGS_DIR = _settings.logs_dir
+
+SCRAPING_CONFIG = _settings.scraping_config
+
+LOG_LEVEL = _settings.log_level
+LOG_FILE = _settings.log_file
@@ -9,17 +9,85 @@ Applies following transformations:
 5. Export to usable format
 """
 
+import numpy as np
 import pandas as pd
 import re
+import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from src.utils.logger import setup_logger
-from src.utils.file_handler import save_to_json, save_to_csv, load_from_json
+from src.utils.file_handler import save_records_to_json, save_to_csv, save_to_parquet, load_from_json, iter_ndjson, find_latest_file
 from config.settings import RAW_DATA_DIR, PROCESSED_DATA_DIR
 
 
+# Copy-on-write: filtered frames share column data until a column is modified
+pd.set_option('mode.copy_on_write', True)
+
+
+# Muscle name aliases mapped to their canonical form
+_MUSCLE_MAP = {
+    'abs': 'abdominals',
+    'quads': 'quadriceps',
+    'lats': 'lats',
+    'traps': 'trapezius',
+}
+
+# Allowed values for validated fields
+_VALID_LEVELS = frozenset({'beginner', 'intermediate', 'expert'})
+_LEVEL_DTYPE = pd.CategoricalDtype(['beginner', 'intermediate', 'expert'], ordered=True)
+_VALID_CATEGORIES = frozenset({
+    'cardio', 'olympic weightlifting', 'plyometrics',
+    'powerlifting', 'strength', 'stretching', 'strongman'
+})
+
+# Equipment values meaning no equipment is needed
+_NO_EQUIPMENT = frozenset({'body only', 'none', None, ''})
+
+# Low-cardinality columns stored as pandas categoricals once cleaned
+_CATEGORICAL_FIELDS = ('category', 'level', 'equipment', 'force', 'mechanic')
+
+# Name keywords used to classify the movement type
+_PUSH_INDICATORS = ('push', 'press', 'chest', 'triceps', 'shoulders')
+_PULL_INDICATORS = ('pull', 'row', 'back', 'biceps', 'lats')
+
+# Each keyword set compiled once into a single alternation
+_PUSH_RE = re.compile('|'.join(map(re.escape, _PUSH_INDICATORS)))
+_PULL_RE = re.compile('|'.join(map(re.escape, _PULL_INDICATORS)))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_muscle_tuple(muscles: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalize muscle names (memoized, the same lists recur across exercises)"""
+    return tuple(sys.intern(_MUSCLE_MAP.get(m.lower(), m.lower())) for m in muscles)
+
+
+@lru_cache(maxsize=4096)
+def _merge_muscle_tuples(primary: Tuple[str, ...], secondary: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Union of primary and secondary muscles (memoized)"""
+    return tuple({*primary, *secondary})
+
+
+def _as_muscle_tuple(muscles) -> Tuple[str, ...]:
+    """Normalize muscle list into a tuple"""
+    if not isinstance(muscles, list):
+        return ()
+    return _normalize_muscle_tuple(tuple(muscles))
+
+
+@dataclass
+class ExerciseStats:
+    """Counters collected while processing exercises"""
+    total_exercises: int = 0
+    valid_exercises: int = 0
+    invalid_exercises: int = 0
+    duplicates_removed: int = 0
+    fields_cleaned: int = 0
+
+
 class ExerciseProcessor:
     """
     Processor to clean and transform exercise data
@@ -35,32 +103,33 @@ class ExerciseProcessor:
     def __init__(self):
         """Initialize processor and logging system"""
         self.logger = setup_logger(self.__class__.__name__)
-        self.stats = {
-            'total_exercises': 0,
-            'valid_exercises': 0,
-            'invalid_exercises': 0,
-            'duplicates_removed': 0,
-            'fields_cleaned': 0
-        }
+        PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.stats = ExerciseStats()
     
     def load_raw_data(self, filepath: Path) -> Tuple[Dict, pd.DataFrame]:
         """
-        Load raw data from JSON file
+        Load raw data from NDJSON or legacy JSON file
         
         Args:
-            filepath: Path to raw JSON file
+            filepath: Path to raw NDJSON (metadata line + one exercise
+                per line) or JSON (metadata + exercises object) file
             
         Returns:
             Tuple containing (metadata, exercises DataFrame)
         """
         self.logger.info(f"Loading data from {filepath}")
         
-        raw_data = load_from_json(filepath)
-        metadata = raw_data.get('metadata', {})
-        exercises = raw_data.get('exercises', [])
-        df = pd.DataFrame(exercises)
-        
-        self.stats['total_exercises'] = len(df)
+        if filepath.suffix == '.ndjson':
+            lines = iter_ndjson(filepath)
+            metadata = next(lines, {})
+            # Lines are parsed one at a time as from_records consumes the generator
+            df = pd.DataFrame.from_records(lines)
+        else:
+            raw_data = load_from_json(filepath)
+            metadata = raw_data.get('metadata', {})
+            df = pd.DataFrame.from_records(raw_data.get('exercises', []))
+        
+        self.stats.total_exercises = len(df)
         self.logger.info(f"{len(df)} exercises loaded")
         
         return metadata, df
@@ -91,33 +160,27 @@ class ExerciseProcessor:
                 df[field] = None
         
         mask = df['name'].notna() & df['id'].notna()
-        df = df[mask].copy()
+        df = df.loc[mask]
         
         for list_field in ['primaryMuscles', 'secondaryMuscles', 'instructions']:
             if list_field in df.columns:
-                df[list_field] = df[list_field].apply(
-                    lambda x: x if isinstance(x, list) else []
-                )
-        
-        valid_levels = ['beginner', 'intermediate', 'expert']
-        df['level'] = df['level'].apply(
-            lambda x: x if x in valid_levels else 'intermediate'
-        )
-        
-        valid_categories = [
-            'cardio', 'olympic weightlifting', 'plyometrics',
-            'powerlifting', 'strength', 'stretching', 'strongman'
-        ]
-        df['category'] = df['category'].apply(
-            lambda x: x if x in valid_categories else 'strength'
+                df[list_field] = [
+                    x if isinstance(x, list) else [] for x in df[list_field].to_numpy()
+                ]
+        
+        df['level'] = df['level'].where(
+            df['level'].isin(_VALID_LEVELS), 'intermediate'
+        ).astype(_LEVEL_DTYPE)
+        df['category'] = df['category'].where(
+            df['category'].isin(_VALID_CATEGORIES), 'strength'
         )
         
-        self.stats['valid_exercises'] = len(df)
-        self.stats['invalid_exercises'] = initial_count - len(df)
+        self.stats.valid_exercises = len(df)
+        self.stats.invalid_exercises = initial_count - len(df)
         
         self.logger.info(
-            f"Validation complete: {self.stats['valid_exercises']} valid, "
-            f"{self.stats['invalid_exercises']} rejected"
+            f"Validation complete: {self.stats.valid_exercises} valid, "
+            f"{self.stats.invalid_exercises} rejected"
         )
         
         return df
@@ -130,6 +193,7 @@ class ExerciseProcessor:
         - Trim whitespace
         - Normalize case
         - Remove unwanted special characters
+        - Store low-cardinality columns as categoricals
         
         Args:
             df: Exercises DataFrame
@@ -143,10 +207,15 @@ class ExerciseProcessor:
         
         for field in text_fields:
             if field in df.columns:
-                df[field] = df[field].apply(
-                    lambda x: x.strip().lower() if isinstance(x, str) else x
-                )
-                self.stats['fields_cleaned'] += 1
+                values = df[field]
+                cleaned = values.str.strip().str.lower()
+                # .str yields NaN for non-string values, keep those as they were
+                df[field] = cleaned.where(cleaned.notna(), values)
+                self.stats.fields_cleaned += 1
+        
+        for field in _CATEGORICAL_FIELDS:
+            if field in df.columns:
+                df[field] = df[field].astype('category')
         
         return df
     
@@ -167,31 +236,19 @@ class ExerciseProcessor:
         """
         self.logger.info("Normalizing muscle groups...")
         
-        muscle_mapping = {
-            'abs': 'abdominals',
-            'quads': 'quadriceps',
-            'lats': 'lats',
-            'traps': 'trapezius',
-        }
-        
-        def normalize_muscle_list(muscles):
-            """Normalize muscle list"""
-            if not isinstance(muscles, list):
-                return []
-            return [muscle_mapping.get(m.lower(), m.lower()) for m in muscles]
-        
-        df['primaryMuscles'] = df['primaryMuscles'].apply(normalize_muscle_list)
-        df['secondaryMuscles'] = df['secondaryMuscles'].apply(normalize_muscle_list)
-        
-        df['all_muscles'] = df.apply(
-            lambda row: list(set(row['primaryMuscles'] + row['secondaryMuscles'])),
-            axis=1
+        primary = [_as_muscle_tuple(x) for x in df['primaryMuscles'].to_numpy()]
+        secondary = [_as_muscle_tuple(x) for x in df['secondaryMuscles'].to_numpy()]
+        all_muscles = [_merge_muscle_tuples(p, s) for p, s in zip(primary, secondary)]
+        muscle_count = np.fromiter(
+            (len(m) for m in all_muscles), dtype=np.int32, count=len(all_muscles)
         )
         
-        df['muscle_count'] = df['all_muscles'].apply(len)
-        
-        df['exercise_type'] = df['muscle_count'].apply(
-            lambda x: 'compound' if x > 2 else 'isolation'
+        df['primaryMuscles'] = [list(m) for m in primary]
+        df['secondaryMuscles'] = [list(m) for m in secondary]
+        df['all_muscles'] = [list(m) for m in all_muscles]
+        df['muscle_count'] = muscle_count
+        df['exercise_type'] = pd.Categorical(
+            np.where(muscle_count > 2, 'compound', 'isolation')
         )
         
         return df
@@ -214,36 +271,33 @@ class ExerciseProcessor:
         """
         self.logger.info("Enriching data...")
         
-        level_scores = {'beginner': 1, 'intermediate': 2, 'expert': 3}
-        df['difficulty_score'] = df['level'].map(level_scores)
+        # Level categories are ordered beginner < intermediate < expert
+        level = df['level'].astype(_LEVEL_DTYPE)
+        df['difficulty_score'] = level.cat.codes.astype(np.int8) + 1
         
-        df['instruction_count'] = df['instructions'].apply(len)
-        df['complexity_score'] = df.apply(
-            lambda row: row['difficulty_score'] + (row['instruction_count'] / 10),
-            axis=1
+        df['instruction_count'] = np.fromiter(
+            (len(x) if isinstance(x, list) else 0 for x in df['instructions'].to_numpy()),
+            dtype=np.int16,
+            count=len(df)
         )
-        
-        df['requires_equipment'] = df['equipment'].apply(
-            lambda x: x not in ['body only', 'none', None]
+        df['complexity_score'] = (
+            df['difficulty_score'].to_numpy(dtype=np.float64)
+            + df['instruction_count'].to_numpy(dtype=np.float64) / 10
         )
         
-        push_indicators = ['push', 'press', 'chest', 'triceps', 'shoulders']
-        pull_indicators = ['pull', 'row', 'back', 'biceps', 'lats']
+        no_equipment = df['equipment'].isin(_NO_EQUIPMENT) | df['equipment'].isna()
+        df['requires_equipment'] = (~no_equipment).to_numpy()
         
-        def categorize_movement(row):
-            """Categorize movement type"""
-            name_lower = row['name'].lower() if isinstance(row['name'], str) else ''
-            
-            if any(word in name_lower for word in push_indicators):
-                return 'push'
-            elif any(word in name_lower for word in pull_indicators):
-                return 'pull'
-            elif row['category'] in ['cardio', 'stretching']:
-                return row['category']
-            else:
-                return 'other'
+        names = df['name'].str.lower()
+        is_push = names.str.contains(_PUSH_RE, na=False).to_numpy()
+        is_pull = names.str.contains(_PULL_RE, na=False).to_numpy()
+        is_named_category = df['category'].isin(['cardio', 'stretching']).to_numpy()
         
-        df['movement_type'] = df.apply(categorize_movement, axis=1)
+        df['movement_type'] = pd.Categorical(np.select(
+            [is_push, is_pull, is_named_category],
+            ['push', 'pull', df['category'].to_numpy(dtype=object)],
+            default='other'
+        ))
         
         return df
     
@@ -252,8 +306,8 @@ class ExerciseProcessor:
         Remove duplicate exercises
         
         Strategy:
-        - Identify duplicates by 'id' or 'name'
-        - Keep most complete version
+        - Drop repeated 'id', then repeated 'name' among the remaining rows
+        - Keep first occurrence
         
         Args:
             df: Exercises DataFrame
@@ -264,28 +318,43 @@ class ExerciseProcessor:
         self.logger.info("Removing duplicates...")
         
         initial_count = len(df)
-        df = df.drop_duplicates(subset=['id'], keep='first')
-        df = df.drop_duplicates(subset=['name'], keep='first')
+        id_dup = df['id'].duplicated(keep='first')
+        # Rows already dropped by id must not shadow a later row's name
+        duplicated = id_dup | df['name'].mask(id_dup).duplicated(keep='first')
+        df = df.loc[~duplicated]
         
-        self.stats['duplicates_removed'] = initial_count - len(df)
-        self.logger.info(f"{self.stats['duplicates_removed']} duplicates removed")
+        self.stats.duplicates_removed = initial_count - len(df)
+        self.logger.info(f"{self.stats.duplicates_removed} duplicates removed")
         
         return df
     
-    def add_metadata_columns(self, df: pd.DataFrame, metadata: Dict) -> pd.DataFrame:
+    def add_metadata_columns(
+        self,
+        df: pd.DataFrame,
+        metadata: Dict,
+        processed_at: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """
         Add metadata columns for traceability
         
         Args:
             df: Exercises DataFrame
             metadata: Metadata dictionary
+            processed_at: Run timestamp (defaults to now)
             
         Returns:
             DataFrame with metadata
         """
-        df['data_source'] = metadata.get('source', 'ExerciseDB')
-        df['scraped_at'] = metadata.get('scraped_at', datetime.now().isoformat())
-        df['processed_at'] = datetime.now().isoformat()
+        now_iso = (processed_at or datetime.now()).isoformat()
+        
+        # Constant columns: a categorical stores the string once plus integer codes
+        df['data_source'] = pd.Series(
+            metadata.get('source', 'ExerciseDB'), index=df.index, dtype='category'
+        )
+        df['scraped_at'] = pd.Series(
+            metadata.get('scraped_at', now_iso), index=df.index, dtype='category'
+        )
+        df['processed_at'] = pd.Series(now_iso, index=df.index, dtype='category')
         
         return df
     
@@ -296,75 +365,86 @@ class ExerciseProcessor:
         Returns:
             Statistics dictionary
         """
-        return self.stats
+        return asdict(self.stats)
     
     def export_processed_data(
         self,
         df: pd.DataFrame,
         metadata: Dict,
-        output_format: str = 'both'
+        output_format: str = 'both',
+        processed_at: Optional[datetime] = None
     ) -> Dict[str, Path]:
         """
-        Export processed data to JSON and/or CSV
+        Export processed data to JSON, CSV and/or Parquet
         
         Args:
             df: Processed exercises DataFrame
             metadata: Metadata to include
-            output_format: 'json', 'csv' or 'both'
+            output_format: 'json', 'csv', 'parquet', 'both' (JSON + CSV) or 'all'
+            processed_at: Run timestamp used for file names and metadata (defaults to now)
             
         Returns:
             Dictionary of created file paths
         """
         self.logger.info(f"Exporting data in {output_format} format...")
         
-        PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = processed_at or datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         exported_files = {}
         
-        if output_format in ['json', 'both']:
+        if output_format in ['json', 'both', 'all']:
             json_filename = f'exercises_processed_{timestamp}.json'
             json_filepath = PROCESSED_DATA_DIR / json_filename
             
-            output_data = {
-                'metadata': {
-                    **metadata,
-                    'processing_stats': self.stats,
-                    'processed_at': datetime.now().isoformat(),
-                    'total_processed_exercises': len(df)
-                },
-                'exercises': df.to_dict('records')
+            output_metadata = {
+                **metadata,
+                'processing_stats': asdict(self.stats),
+                'processed_at': now.isoformat(),
+                'total_processed_exercises': len(df)
             }
             
-            save_to_json(output_data, json_filepath)
+            save_records_to_json(output_metadata, df, 'exercises', json_filepath)
             exported_files['json'] = json_filepath
             self.logger.info(f"JSON saved: {json_filepath}")
         
-        if output_format in ['csv', 'both']:
+        if output_format in ['csv', 'both', 'all']:
             csv_filename = f'exercises_processed_{timestamp}.csv'
             csv_filepath = PROCESSED_DATA_DIR / csv_filename
             
-            df_csv = df.copy()
-            
             list_columns = ['primaryMuscles', 'secondaryMuscles', 'all_muscles', 'instructions', 'images']
-            for col in list_columns:
-                if col in df_csv.columns:
-                    df_csv[col] = df_csv[col].apply(
-                        lambda x: '|'.join(x) if isinstance(x, list) else ''
-                    )
+            joined_columns = {
+                col: ['|'.join(x) if isinstance(x, list) else '' for x in df[col].to_numpy()]
+                for col in list_columns
+                if col in df.columns
+            }
             
-            save_to_csv(df_csv, csv_filepath)
+            # Only the joined list columns are new, the others are shared with df
+            save_to_csv(df.assign(**joined_columns), csv_filepath)
             exported_files['csv'] = csv_filepath
             self.logger.info(f"CSV saved: {csv_filepath}")
         
+        if output_format in ['parquet', 'all']:
+            parquet_filename = f'exercises_processed_{timestamp}.parquet'
+            parquet_filepath = PROCESSED_DATA_DIR / parquet_filename
+            
+            save_to_parquet(df, parquet_filepath)
+            exported_files['parquet'] = parquet_filepath
+            self.logger.info(f"Parquet saved: {parquet_filepath}")
+        
         return exported_files
     
-    def run(self, input_file: Path, output_format: str = 'both') -> Dict[str, Path]:
+    def run(
+        self,
+        input_file: Path,
+        output_format: str = 'both',
+        schema_validation: bool = True
+    ) -> Dict[str, Path]:
         """
         Execute complete processing pipeline
         
         Pipeline:
         1. Load raw data
-        2. Validation
+        2. Validation (skipped when schema_validation is False)
         3. Cleaning
         4. Normalization
         5. Enrichment
@@ -373,7 +453,8 @@ class ExerciseProcessor:
         
         Args:
             input_file: Path to raw JSON file
-            output_format: Export format ('json', 'csv', 'both')
+            output_format: Export format ('json', 'csv', 'parquet', 'both', 'all')
+            schema_validation: Set to False for trusted inputs to bypass validate_data
             
         Returns:
             Dictionary of exported files
@@ -382,20 +463,27 @@ class ExerciseProcessor:
         self.logger.info("Starting ExerciseDB processing pipeline")
         self.logger.info("=" * 60)
         
+        # One timestamp for the whole run, shared by columns and file names
+        processed_at = datetime.now()
+        
         try:
             metadata, df = self.load_raw_data(input_file)
-            df = self.validate_data(df)
+            if schema_validation:
+                df = self.validate_data(df)
+            else:
+                self.logger.info("Schema validation skipped (trusted input)")
+                self.stats.valid_exercises = len(df)
             df = self.clean_text_fields(df)
             df = self.normalize_muscle_groups(df)
             df = self.enrich_data(df)
             df = self.remove_duplicates(df)
-            df = self.add_metadata_columns(df, metadata)
-            exported_files = self.export_processed_data(df, metadata, output_format)
+            df = self.add_metadata_columns(df, metadata, processed_at)
+            exported_files = self.export_processed_data(df, metadata, output_format, processed_at)
             
             self.logger.info("\n" + "=" * 60)
             self.logger.info("Processing Statistics")
             self.logger.info("=" * 60)
-            for key, value in self.stats.items():
+            for key, value in asdict(self.stats).items():
                 self.logger.info(f"{key}: {value}")
             
             self.logger.info("\n✅ Processing pipeline completed successfully")
@@ -410,11 +498,9 @@ class ExerciseProcessor:
 if __name__ == "__main__":
     processor = ExerciseProcessor()
     
-    raw_files = list(RAW_DATA_DIR.glob('exercisedb_raw_*.json'))
+    latest_file = find_latest_file(RAW_DATA_DIR, 'exercisedb_raw_*.ndjson', 'exercisedb_raw_*.json')
     
-    if raw_files:
-        latest_file = sorted(raw_files, key=lambda p: p.stat().st_mtime, reverse=True)[0]
-        
+    if latest_file is not None:
         print(f"\n📁 Source file: {latest_file.name}")
         
         exported = processor.run(latest_file, output_format='both')
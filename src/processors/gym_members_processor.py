@@ -9,15 +9,91 @@ Applies following transformations:
 5. Export to usable format
 """
 
+import numpy as np
 import pandas as pd
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from src.utils.logger import setup_logger
-from src.utils.file_handler import save_to_json, save_to_csv, load_from_json
+from src.utils.file_handler import save_records_to_json, save_to_csv, save_to_parquet, load_from_csv
 from config.settings import RAW_DATA_DIR, PROCESSED_DATA_DIR
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional JIT for the fitness score kernel
+    njit = None
+
+
+# Copy-on-write: filtered frames share column data until a column is modified
+pd.set_option('mode.copy_on_write', True)
+
+
+# Raw values mapped to their normalized form
+_GENDER_MAP = {
+    'male': 'M',
+    'm': 'M',
+    'female': 'F',
+    'f': 'F'
+}
+_EXPERIENCE_LEVEL_MAP = {
+    '1': 'beginner',
+    '2': 'intermediate',
+    '3': 'expert'
+}
+
+# Ordered so that category codes + 1 give the experience score
+_EXPERIENCE_LEVEL_DTYPE = pd.CategoricalDtype(
+    ['beginner', 'intermediate', 'expert'], ordered=True
+)
+
+# Accepted (column, min, max) ranges, bounds included
+_RANGE_RULES = [
+    ('age', 15, 100),
+    ('weight_(kg)', 30, 200),
+    ('height_(m)', 1.2, 2.2),
+    ('bmi', 10, 50),
+    ('max_bpm', 40, 220),
+    ('avg_bpm', 40, 220),
+]
+
+# Category bins, each interval includes its lower bound
+_BMI_BINS = [-np.inf, 18.5, 25, 30, np.inf]
+_BMI_LABELS = ['underweight', 'normal', 'overweight', 'obese']
+_AGE_BINS = [-np.inf, 25, 35, 45, 55, np.inf]
+_AGE_LABELS = ['18-24', '25-34', '35-44', '45-54', '55+']
+_BODY_FAT_BINS_MALE = [-np.inf, 6, 14, 18, 25, np.inf]
+_BODY_FAT_BINS_FEMALE = [-np.inf, 14, 21, 25, 32, np.inf]
+_BODY_FAT_LABELS = ['essential', 'athletic', 'fit', 'average', 'obese']
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fitness_kernel(max_bpm, calories, frequency, out):
+        for i in prange(max_bpm.shape[0]):
+            out[i] = max_bpm[i] / 220 * 20 + calories[i] / 100 * 30 + frequency[i] * 10
+
+
+def _fitness_score(max_bpm: np.ndarray, calories: np.ndarray, frequency: np.ndarray) -> np.ndarray:
+    """Weighted fitness score, computed in one fused pass when numba is available"""
+    if njit is None:
+        return max_bpm / 220 * 20 + calories / 100 * 30 + frequency * 10
+    
+    out = np.empty_like(max_bpm)
+    _fitness_kernel(max_bpm, calories, frequency, out)
+    return out
+
+
+@dataclass
+class GymMembersStats:
+    """Counters collected while processing gym members"""
+    total_members: int = 0
+    valid_members: int = 0
+    invalid_members: int = 0
+    duplicates_removed: int = 0
+    fields_cleaned: int = 0
+
 
 class GymMembersProcessor:
     """
@@ -34,13 +110,8 @@ class GymMembersProcessor:
     def __init__(self):
         """Initialize processor and logging system"""
         self.logger = setup_logger(self.__class__.__name__)
-        self.stats = {
-            'total_members': 0,
-            'valid_members': 0,
-            'invalid_members': 0,
-            'duplicates_removed': 0,
-            'fields_cleaned': 0
-        }
+        PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.stats = GymMembersStats()
     
     def load_raw_data(self, filepath: Path) -> pd.DataFrame:
         """
@@ -54,9 +125,9 @@ class GymMembersProcessor:
         """
         self.logger.info(f"Loading data from {filepath}")
         
-        df = pd.read_csv(filepath)
+        df = load_from_csv(filepath)
         
-        self.stats['total_members'] = len(df)
+        self.stats.total_members = len(df)
         self.logger.info(f"{len(df)} members loaded")
         
         return df
@@ -85,34 +156,19 @@ class GymMembersProcessor:
         # Normalize column names (lowercase, remove spaces)
         df.columns = df.columns.str.lower().str.replace(' ', '_')
         
-        # Validate age
-        if 'age' in df.columns:
-            df = df[(df['age'] >= 15) & (df['age'] <= 100)]
-        
-        # Validate weight
-        if 'weight_(kg)' in df.columns:
-            df = df[(df['weight_(kg)'] >= 30) & (df['weight_(kg)'] <= 200)]
-        
-        # Validate height
-        if 'height_(m)' in df.columns:
-            df = df[(df['height_(m)'] >= 1.2) & (df['height_(m)'] <= 2.2)]
-        
-        # Validate BMI
-        if 'bmi' in df.columns:
-            df = df[(df['bmi'] >= 10) & (df['bmi'] <= 50)]
-        
-        # Validate heart rate
-        if 'max_bpm' in df.columns:
-            df = df[(df['max_bpm'] >= 40) & (df['max_bpm'] <= 220)]
-        if 'avg_bpm' in df.columns:
-            df = df[(df['avg_bpm'] >= 40) & (df['avg_bpm'] <= 220)]
+        # Combine every range rule into one mask and filter once
+        mask = np.ones(len(df), dtype=bool)
+        for col, low, high in _RANGE_RULES:
+            if col in df.columns:
+                mask &= df[col].between(low, high).to_numpy(dtype=bool, na_value=False)
+        df = df.loc[mask]
         
-        self.stats['valid_members'] = len(df)
-        self.stats['invalid_members'] = initial_count - len(df)
+        self.stats.valid_members = len(df)
+        self.stats.invalid_members = initial_count - len(df)
         
         self.logger.info(
-            f"Validation complete: {self.stats['valid_members']} valid, "
-            f"{self.stats['invalid_members']} rejected"
+            f"Validation complete: {self.stats.valid_members} valid, "
+            f"{self.stats.invalid_members} rejected"
         )
         
         return df
@@ -125,6 +181,7 @@ class GymMembersProcessor:
         - Normalize gender values
         - Standardize workout types
         - Clean experience levels
+        - Store gender and workout type as categoricals
         
         Args:
             df: Members DataFrame
@@ -136,29 +193,25 @@ class GymMembersProcessor:
         
         # Normalize gender
         if 'gender' in df.columns:
-            df['gender'] = df['gender'].str.lower().str.strip()
-            df['gender'] = df['gender'].replace({
-                'male': 'M',
-                'm': 'M',
-                'female': 'F',
-                'f': 'F'
-            })
-            self.stats['fields_cleaned'] += 1
+            gender = df['gender'].str.lower().str.strip()
+            df['gender'] = gender.map(_GENDER_MAP).fillna(gender)
+            self.stats.fields_cleaned += 1
         
         # Normalize workout type
         if 'workout_type' in df.columns:
             df['workout_type'] = df['workout_type'].str.lower().str.strip()
-            self.stats['fields_cleaned'] += 1
+            self.stats.fields_cleaned += 1
         
         # Normalize experience level
+        # Levels are numeric (1-3) in the Kaggle CSV, so go through strings first
         if 'experience_level' in df.columns:
-            df['experience_level'] = df['experience_level'].str.lower().str.strip()
-            df['experience_level'] = df['experience_level'].replace({
-                '1': 'beginner',
-                '2': 'intermediate',
-                '3': 'expert'
-            })
-            self.stats['fields_cleaned'] += 1
+            level = df['experience_level'].astype('string').str.strip().str.lower()
+            df['experience_level'] = level.map(_EXPERIENCE_LEVEL_MAP).fillna(level)
+            self.stats.fields_cleaned += 1
+        
+        for field in ['gender', 'workout_type']:
+            if field in df.columns:
+                df[field] = df[field].astype('category')
         
         return df
     
@@ -183,41 +236,24 @@ class GymMembersProcessor:
         
         # BMI Category
         if 'bmi' in df.columns:
-            def categorize_bmi(bmi):
-                if bmi < 18.5:
-                    return 'underweight'
-                elif bmi < 25:
-                    return 'normal'
-                elif bmi < 30:
-                    return 'overweight'
-                else:
-                    return 'obese'
-            
-            df['bmi_category'] = df['bmi'].apply(categorize_bmi)
+            df['bmi_category'] = pd.cut(
+                df['bmi'], bins=_BMI_BINS, labels=_BMI_LABELS, right=False
+            )
         
         # Age Group
         if 'age' in df.columns:
-            def categorize_age(age):
-                if age < 25:
-                    return '18-24'
-                elif age < 35:
-                    return '25-34'
-                elif age < 45:
-                    return '35-44'
-                elif age < 55:
-                    return '45-54'
-                else:
-                    return '55+'
-            
-            df['age_group'] = df['age'].apply(categorize_age)
+            df['age_group'] = pd.cut(
+                df['age'], bins=_AGE_BINS, labels=_AGE_LABELS, right=False
+            )
         
         # Fitness Score (based on multiple factors)
         if all(col in df.columns for col in ['max_bpm', 'calories_burned', 'workout_frequency_(days/week)']):
-            df['fitness_score'] = (
-                (df['max_bpm'] / 220 * 20) +
-                (df['calories_burned'] / 100 * 30) +
-                (df['workout_frequency_(days/week)'] * 10)
-            ).round(2)
+            fitness_score = _fitness_score(
+                df['max_bpm'].to_numpy(dtype=np.float64, na_value=np.nan),
+                df['calories_burned'].to_numpy(dtype=np.float64, na_value=np.nan),
+                df['workout_frequency_(days/week)'].to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+            df['fitness_score'] = np.round(fitness_score, 2)
         
         # Heart Rate Reserve (HRR)
         if 'max_bpm' in df.columns and 'avg_bpm' in df.columns:
@@ -229,45 +265,24 @@ class GymMembersProcessor:
                 df['calories_burned'] / df['session_duration_(hours)']
             ).round(2)
         
-        # Body Fat Category
+        # Body Fat Category (thresholds depend on gender)
         if 'body_fat_%' in df.columns and 'gender' in df.columns:
-            def categorize_body_fat(row):
-                bf = row['body_fat_%']
-                gender = row['gender']
-                
-                if gender == 'M':
-                    if bf < 6:
-                        return 'essential'
-                    elif bf < 14:
-                        return 'athletic'
-                    elif bf < 18:
-                        return 'fit'
-                    elif bf < 25:
-                        return 'average'
-                    else:
-                        return 'obese'
-                else:  # Female
-                    if bf < 14:
-                        return 'essential'
-                    elif bf < 21:
-                        return 'athletic'
-                    elif bf < 25:
-                        return 'fit'
-                    elif bf < 32:
-                        return 'average'
-                    else:
-                        return 'obese'
-            
-            df['body_fat_category'] = df.apply(categorize_body_fat, axis=1)
+            body_fat_male = pd.cut(
+                df['body_fat_%'], bins=_BODY_FAT_BINS_MALE, labels=_BODY_FAT_LABELS, right=False
+            )
+            body_fat_female = pd.cut(
+                df['body_fat_%'], bins=_BODY_FAT_BINS_FEMALE, labels=_BODY_FAT_LABELS, right=False
+            )
+            is_male = df['gender'].eq('M').to_numpy(dtype=bool, na_value=False)
+            df['body_fat_category'] = body_fat_male.where(is_male, body_fat_female)
         
         # Experience Level Score
         if 'experience_level' in df.columns:
-            experience_scores = {
-                'beginner': 1,
-                'intermediate': 2,
-                'expert': 3
-            }
-            df['experience_score'] = df['experience_level'].map(experience_scores)
+            level = df['experience_level'].astype(_EXPERIENCE_LEVEL_DTYPE)
+            codes = level.cat.codes
+            # Unknown levels get code -1 and are left without a score
+            df['experience_score'] = (codes + 1).astype('Int8').mask(codes < 0)
+            df['experience_level'] = level
         
         return df
     
@@ -297,66 +312,75 @@ class GymMembersProcessor:
         if duplicate_cols:
             df = df.drop_duplicates(subset=duplicate_cols, keep='first')
         
-        self.stats['duplicates_removed'] = initial_count - len(df)
-        self.logger.info(f"{self.stats['duplicates_removed']} duplicates removed")
+        self.stats.duplicates_removed = initial_count - len(df)
+        self.logger.info(f"{self.stats.duplicates_removed} duplicates removed")
         
         return df
     
-    def add_metadata_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_metadata_columns(
+        self,
+        df: pd.DataFrame,
+        processed_at: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """
         Add metadata columns for traceability
         
         Args:
             df: Members DataFrame
+            processed_at: Run timestamp (defaults to now)
             
         Returns:
             DataFrame with metadata
         """
-        df['data_source'] = 'Kaggle - Gym Members Exercise Dataset'
-        df['processed_at'] = datetime.now().isoformat()
+        now_iso = (processed_at or datetime.now()).isoformat()
+        
+        # Constant columns: a categorical stores the string once plus integer codes
+        df['data_source'] = pd.Series(
+            'Kaggle - Gym Members Exercise Dataset', index=df.index, dtype='category'
+        )
+        df['processed_at'] = pd.Series(now_iso, index=df.index, dtype='category')
         
         return df
     
     def export_processed_data(
         self,
         df: pd.DataFrame,
-        output_format: str = 'both'
+        output_format: str = 'both',
+        processed_at: Optional[datetime] = None
     ) -> Dict[str, Path]:
         """
-        Export processed data to JSON and/or CSV
+        Export processed data to JSON, CSV and/or Parquet
         
         Args:
             df: Processed members DataFrame
-            output_format: 'json', 'csv' or 'both'
+            output_format: 'json', 'csv', 'parquet', 'both' (JSON + CSV) or 'all'
+            processed_at: Run timestamp used for file names and metadata (defaults to now)
             
         Returns:
             Dictionary of created file paths
         """
         self.logger.info(f"Exporting data in {output_format} format...")
         
-        PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = processed_at or datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         exported_files = {}
         
-        if output_format in ['json', 'both']:
+        if output_format in ['json', 'both', 'all']:
             json_filename = f'gym_members_processed_{timestamp}.json'
             json_filepath = PROCESSED_DATA_DIR / json_filename
             
-            output_data = {
-                'metadata': {
-                    'source': 'Kaggle - Gym Members Exercise Dataset',
-                    'processing_stats': self.stats,
-                    'processed_at': datetime.now().isoformat(),
-                    'total_processed_members': len(df)
-                },
-                'members': df.to_dict('records')
+            output_metadata = {
+                'source': 'Kaggle - Gym Members Exercise Dataset',
+                'processing_stats': asdict(self.stats),
+                'processed_at': now.isoformat(),
+                'total_processed_members': len(df)
             }
             
-            save_to_json(output_data, json_filepath)
+            save_records_to_json(output_metadata, df, 'members', json_filepath)
             exported_files['json'] = json_filepath
             self.logger.info(f"JSON saved: {json_filepath}")
         
-        if output_format in ['csv', 'both']:
+        if output_format in ['csv', 'both', 'all']:
             csv_filename = f'gym_members_processed_{timestamp}.csv'
             csv_filepath = PROCESSED_DATA_DIR / csv_filename
             
@@ -364,6 +388,14 @@ class GymMembersProcessor:
             exported_files['csv'] = csv_filepath
             self.logger.info(f"CSV saved: {csv_filepath}")
         
+        if output_format in ['parquet', 'all']:
+            parquet_filename = f'gym_members_processed_{timestamp}.parquet'
+            parquet_filepath = PROCESSED_DATA_DIR / parquet_filename
+            
+            save_to_parquet(df, parquet_filepath)
+            exported_files['parquet'] = parquet_filepath
+            self.logger.info(f"Parquet saved: {parquet_filepath}")
+        
         return exported_files
     
     def run(self, input_file: Path, output_format: str = 'both') -> Dict[str, Path]:
@@ -380,7 +412,7 @@ class GymMembersProcessor:
         
         Args:
             input_file: Path to raw CSV file
-            output_format: Export format ('json', 'csv', 'both')
+            output_format: Export format ('json', 'csv', 'parquet', 'both', 'all')
             
         Returns:
             Dictionary of exported files
@@ -389,19 +421,22 @@ class GymMembersProcessor:
         self.logger.info("Starting Gym Members processing pipeline")
         self.logger.info("=" * 60)
         
+        # One timestamp for the whole run, shared by columns and file names
+        processed_at = datetime.now()
+        
         try:
             df = self.load_raw_data(input_file)
             df = self.validate_data(df)
             df = self.clean_text_fields(df)
             df = self.enrich_data(df)
             df = self.remove_duplicates(df)
-            df = self.add_metadata_columns(df)
-            exported_files = self.export_processed_data(df, output_format)
+            df = self.add_metadata_columns(df, processed_at)
+            exported_files = self.export_processed_data(df, output_format, processed_at)
             
             self.logger.info("\n" + "=" * 60)
             self.logger.info("Processing Statistics")
             self.logger.info("=" * 60)
-            for key, value in self.stats.items():
+            for key, value in asdict(self.stats).items():
                 self.logger.info(f"{key}: {value}")
             
             self.logger.info("\n✅ Processing pipeline completed successfully")
@@ -1,17 +1,18 @@
 """
 Main script to orchestrate all data processors
 
-This file executes all processing pipelines sequentially:
+This file executes all processing pipelines, each in its own process:
 1. Process ExerciseDB exercises
 2. Process nutrition data (coming soon)
 3. Process user profiles (coming soon)
 
-Usage: python -m src.processors.run_processing
+Usage: python -m src.processors.run_processing [--only {exercisedb,gym_members}]
 """
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from src.processors.exercise_processor import ExerciseProcessor
-from src.processors.gym_members_processor import GymMembersProcessor
+from typing import List, Optional
 from src.utils.logger import setup_logger
 from config.settings import RAW_DATA_DIR
 
@@ -27,16 +28,20 @@ def process_exercisedb():
     logger.info("\n[1/2] Processing ExerciseDB exercises...")
     
     try:
+        # Imported here so a run limited to another pipeline does not pay for it,
+        # and the parent process never loads pandas at all
+        from src.processors.exercise_processor import ExerciseProcessor
+        from src.utils.file_handler import find_latest_file
+        
         processor = ExerciseProcessor()
         
-        raw_files = list(RAW_DATA_DIR.glob('exercisedb_raw_*.json'))
+        latest_file = find_latest_file(RAW_DATA_DIR, 'exercisedb_raw_*.ndjson', 'exercisedb_raw_*.json')
         
-        if not raw_files:
-            logger.error("No exercisedb_raw_*.json file found")
+        if latest_file is None:
+            logger.error("No exercisedb_raw_* file found")
             logger.info("💡 Run first: python -m src.scrapers.exercisedb_scraper")
             return None
         
-        latest_file = sorted(raw_files, key=lambda p: p.stat().st_mtime, reverse=True)[0]
         logger.info(f"Source file: {latest_file.name}")
         
         exported = processor.run(latest_file, output_format='both')
@@ -59,6 +64,11 @@ def process_gym_members():
     logger.info("\n[2/2] Processing Gym Members dataset...")
     
     try:
+        # Imported here so a run limited to another pipeline does not pay for it,
+        # and the parent process never loads pandas at all
+        from src.processors.gym_members_processor import GymMembersProcessor
+        from src.utils.file_handler import find_latest_file
+        
         processor = GymMembersProcessor()
         
         kaggle_dir = RAW_DATA_DIR / 'kaggle' / 'gym-members-exercise-dataset'
@@ -68,13 +78,12 @@ def process_gym_members():
             logger.info("💡 Run first: python -m src.scrapers.kaggle_scraper")
             return None
         
-        csv_files = list(kaggle_dir.glob('*.csv'))
+        latest_file = find_latest_file(kaggle_dir, '*.csv')
         
-        if not csv_files:
+        if latest_file is None:
             logger.error("No CSV file found in gym members directory")
             return None
         
-        latest_file = csv_files[0]
         logger.info(f"Source file: {latest_file.name}")
         
         exported = processor.run(latest_file, output_format='both')
@@ -86,35 +95,51 @@ def process_gym_members():
         return None
 
 
-def main():
+PIPELINES = {
+    'exercisedb': process_exercisedb,
+    'gym_members': process_gym_members
+}
+
+
+def main(argv: Optional[List[str]] = None):
     """
-    Main function: run all processors in order
+    Main function: run all processors concurrently
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:]),
+            '--only NAME' runs a single pipeline from PIPELINES
     """
+    parser = argparse.ArgumentParser(description="Run data processing pipelines")
+    parser.add_argument('--only', choices=list(PIPELINES), help="Run a single pipeline")
+    only = parser.parse_args(argv).only
+    
     logger = setup_logger("ProcessingPipeline")
     
     logger.info("=" * 60)
     logger.info("Starting Data Processing Pipeline")
     logger.info("=" * 60)
     
-    results = {}
+    selected = [only] if only else list(PIPELINES)
     
-    exercisedb_result = process_exercisedb()
-    results['exercisedb'] = exercisedb_result
+    # Pipelines are independent and CPU-bound, so run them side by side
+    with ProcessPoolExecutor(max_workers=len(selected)) as executor:
+        futures = {name: executor.submit(PIPELINES[name]) for name in selected}
     
-    gym_members_result = process_gym_members()
-    results['gym_members'] = gym_members_result
+    results = {name: future.result() for name, future in futures.items()}
     
     logger.info("\n" + "=" * 60)
     logger.info("Processing Pipeline Summary")
     logger.info("=" * 60)
     
+    # One log record for the whole summary
+    lines = []
     for name, result in results.items():
         status = "✅ SUCCESS" if result else "❌ FAILED"
-        logger.info(f"{name}: {status}")
+        lines.append(f"{name}: {status}")
         
         if result and isinstance(result, dict):
-            for format_type, filepath in result.items():
-                logger.info(f"  → {format_type.upper()}: {filepath}")
+            lines.extend(f"  → {format_type.upper()}: {filepath}" for format_type, filepath in result.items())
+    logger.info("\n".join(lines))
     
     successful = sum(1 for r in results.values() if r is not None)
     total = len(results)
@@ -0,0 +1,35 @@
+"""
+Shared thread pool for network-bound scraper work
+
+All scrapers submit their downloads here instead of creating and
+tearing down their own executors.
+"""
+
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Top-level sources only. Tasks must not block on work submitted to this
+# same pool (nested fan-out uses its own executor), or it can deadlock
+MAX_WORKERS = 8
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """
+    Return the shared executor, creating it on first use
+
+    Returns:
+        ThreadPoolExecutor shut down automatically at interpreter exit
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='scraper')
+            atexit.register(_pool.shutdown, wait=True)
+
+    return _pool
@@ -6,13 +6,18 @@ This module automatically downloads a list of exercises
 with their characteristics (muscles, equipment, instructions, etc.)
 """
 
+import hashlib
+import os
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import List, Dict, Optional
 from config.settings import RAW_DATA_DIR, SCRAPING_CONFIG
 from src.utils.logger import setup_logger
-from src.utils.file_handler import save_to_json, generate_filename
+from src.utils.file_handler import save_to_json, save_to_ndjson, load_from_json, generate_filename, find_latest_file
 
 
 class ExerciseDBScraper:
@@ -23,10 +28,12 @@ class ExerciseDBScraper:
     1. Connect to GitHub URL containing JSON data
     2. Download complete exercise list
     3. Extract metadata (categories, equipment, etc.)
-    4. Save to local JSON file
+    4. Save to local NDJSON file
     """
     
     BASE_URL = "https://raw.githubusercontent.com/yuhonas/free-exercise-db/main/dist/exercises.json"
+    ETAG_FILE = RAW_DATA_DIR / '.exercisedb.etag'
+    CATEGORIES_CACHE_DIR = RAW_DATA_DIR / '.cat_cache'
     
     def __init__(self):
         """
@@ -36,6 +43,8 @@ class ExerciseDBScraper:
         - Logger for execution tracking
         - HTTP session for web requests
         - User-Agent configuration
+        - Retry policy with backoff on transient server errors
+        - ETag of the last saved download, if any
         """
         self.logger = setup_logger(self.__class__.__name__)
         self.session = requests.Session()
@@ -43,34 +52,81 @@ class ExerciseDBScraper:
             'User-Agent': SCRAPING_CONFIG['user_agent']
         })
         
+        # Single host, single file: one pooled keep-alive connection is enough
+        retries = Retry(
+            total=SCRAPING_CONFIG['max_retries'],
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504]
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retries))
+        
+        self.etag = self.ETAG_FILE.read_text(encoding='utf-8').strip() if self.ETAG_FILE.is_file() else None
+        # Set by fetch_exercises when upstream answers 304 Not Modified
+        self.unchanged_file: Optional[Path] = None
+        # Digest of the last downloaded payload, keys the categories cache
+        self.content_hash: Optional[str] = None
+        
     def fetch_exercises(self) -> Optional[List[Dict]]:
         """
         Download all exercises from GitHub URL
         
         Process:
-        1. Make HTTP GET request to URL
-        2. Verify request succeeded (code 200)
-        3. Convert JSON response to Python list
+        1. Make conditional HTTP GET request to URL (If-None-Match)
+        2. Stop there if upstream is unchanged (code 304)
+        3. Verify request succeeded (code 200)
+        4. Stream response body to a temporary file
+        5. Parse the file into a Python list
         
         Returns:
             List[Dict]: List of dictionaries containing exercises
-            None: If download fails
+            None: If download fails or upstream is unchanged
+                  (unchanged_file is then set)
         """
         self.logger.info(f"Downloading exercises from {self.BASE_URL}")
         
+        RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = RAW_DATA_DIR / '.exercisedb.tmp'
+        self.unchanged_file = None
+        self.content_hash = None
+        
+        # Only revalidate when there is a previous download to fall back on
+        latest_file = find_latest_file(RAW_DATA_DIR, 'exercisedb_raw_*.ndjson', 'exercisedb_raw_*.json')
+        headers = {'If-None-Match': self.etag} if self.etag and latest_file else {}
+        
         try:
-            response = self.session.get(
+            # Stream to disk so the body is never buffered in memory alongside the parsed list
+            with self.session.get(
                 self.BASE_URL,
-                timeout=SCRAPING_CONFIG['timeout']
-            )
-            response.raise_for_status()
-            exercises = response.json()
+                headers=headers,
+                timeout=SCRAPING_CONFIG['timeout'],
+                stream=True
+            ) as response:
+                if response.status_code == 304:
+                    self.logger.info(f"Upstream unchanged, keeping {latest_file}")
+                    self.unchanged_file = latest_file
+                    return None
+                
+                response.raise_for_status()
+                self.etag = response.headers.get('ETag')
+                digest = hashlib.blake2b(digest_size=16)
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        digest.update(chunk)
+                        f.write(chunk)
+                self.content_hash = digest.hexdigest()
+            
+            exercises = load_from_json(tmp_path)
             self.logger.info(f"Success: {len(exercises)} exercises downloaded")
             return exercises
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Download failed: {e}")
             return None
+        except ValueError as e:
+            self.logger.error(f"Invalid JSON response: {e}")
+            return None
+        finally:
+            tmp_path.unlink(missing_ok=True)
     
     def fetch_exercise_categories(self, exercises: List[Dict]) -> Dict[str, List[str]]:
         """
@@ -88,68 +144,126 @@ class ExerciseDBScraper:
             Dict: Dictionary with 3 keys (bodyParts, equipment, targets)
                   each containing sorted list of unique values
         """
+        # Each set is built in one pass over the exercises, with empty values filtered out
         categories = {
-            'bodyParts': set(),
-            'equipment': set(),
-            'targets': set()
+            'bodyParts': set(chain.from_iterable(
+                filter(None, (exercise.get('primaryMuscles') for exercise in exercises))
+            )),
+            'equipment': set(filter(None, (exercise.get('equipment') for exercise in exercises))),
+            'targets': set(filter(None, (exercise.get('category') for exercise in exercises)))
         }
         
-        for exercise in exercises:
-            if 'primaryMuscles' in exercise and exercise['primaryMuscles']:
-                categories['bodyParts'].update(exercise['primaryMuscles'])
-            
-            if 'equipment' in exercise and exercise['equipment']:
-                categories['equipment'].add(exercise['equipment'])
+        # Equipment and targets are filtered on truthiness, muscle lists may still hold None
+        categories['bodyParts'].discard(None)
+        
+        return {key: sorted(values) for key, values in categories.items()}
+    
+    def get_categories(self, exercises: List[Dict]) -> Dict[str, List[str]]:
+        """
+        Return exercise categories, reusing the cached result for this payload
+        
+        The cache entry is keyed by the BLAKE2b digest of the downloaded
+        bytes, so identical payloads never get rescanned. Only the entry
+        for the current payload is kept, and an unreadable entry is
+        treated as a miss.
+        
+        Args:
+            exercises: List of downloaded exercises
             
-            if 'category' in exercise and exercise['category']:
-                categories['targets'].add(exercise['category'])
+        Returns:
+            Dict: Same structure as fetch_exercise_categories
+        """
+        if self.content_hash is None:
+            return self.fetch_exercise_categories(exercises)
+        
+        cache_path = self.CATEGORIES_CACHE_DIR / f'{self.content_hash}.json'
+        if cache_path.is_file():
+            try:
+                categories = load_from_json(cache_path)
+            except ValueError as e:
+                self.logger.warning(f"Ignoring unreadable categories cache {cache_path.name}: {e}")
+            else:
+                self.logger.info(f"Categories loaded from cache {cache_path.name}")
+                return categories
+        
+        categories = self.fetch_exercise_categories(exercises)
+        
+        # Written to a temporary file then renamed, like the ETag
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        save_to_json(categories, tmp_path)
+        os.replace(tmp_path, cache_path)
+        
+        # Entries for older payloads will never be hit again
+        for stale_path in self.CATEGORIES_CACHE_DIR.glob('*.json'):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
         
-        return {key: sorted([v for v in values if v is not None]) for key, values in categories.items()}
+        return categories
     
-    def save_data(self, exercises: List[Dict], filename: Optional[str] = None) -> Path:
+    def save_data(self, data: Dict, filename: Optional[str] = None) -> Path:
         """
-        Save data to JSON file
+        Save data to NDJSON file
         
-        Creates JSON file with all fetched data.
+        First line holds the metadata, each following line one exercise,
+        so the file can be consumed line by line.
         Filename includes timestamp for version tracking.
         
         Args:
-            exercises: Data to save (dict with metadata + exercises)
+            data: Data to save (dict with metadata + exercises)
             filename: Filename (optional, auto-generated if not provided)
             
         Returns:
             Path: Full path to created file
         """
         if filename is None:
-            filename = generate_filename('exercisedb_raw')
+            filename = generate_filename('exercisedb_raw', 'ndjson')
         
         filepath = RAW_DATA_DIR / filename
-        save_to_json(exercises, filepath)
-        self.logger.info(f"Saved {len(exercises)} exercises to {filepath}")
+        save_to_ndjson(data['metadata'], data['exercises'], filepath)
+        self.logger.info(f"Saved {len(data['exercises'])} exercises to {filepath}")
         return filepath
     
+    def save_etag(self) -> None:
+        """
+        Persist the ETag of the last saved download
+        
+        Written to a temporary file then renamed, so a crash never
+        leaves a truncated ETag behind.
+        """
+        if not self.etag:
+            return
+        
+        tmp_path = self.ETAG_FILE.with_name(self.ETAG_FILE.name + '.tmp')
+        tmp_path.write_text(self.etag, encoding='utf-8')
+        os.replace(tmp_path, self.ETAG_FILE)
+    
     def run(self) -> Optional[Path]:
         """
         Execute complete scraping pipeline
         
         Steps:
-        1. Download exercises from URL
+        1. Download exercises from URL (reuse latest file if unchanged)
         2. Extract metadata (categories)
         3. Structure data with metadata
-        4. Save to JSON file
+        4. Save to NDJSON file
         
         Returns:
-            Path: Path to created file
+            Path: Path to created (or reused) file
             None: If error occurred
         """
         self.logger.info("Starting ExerciseDB scraping pipeline")
         
         exercises = self.fetch_exercises()
+        if self.unchanged_file is not None:
+            return self.unchanged_file
         if exercises is None:
             self.logger.error("Scraping failed - no data retrieved")
             return None
         
-        categories = self.fetch_exercise_categories(exercises)
+        # Single clock read shared by the metadata and the filename
+        now = datetime.now()
+        
+        categories = self.get_categories(exercises)
         self.logger.info(f"Categories found: {categories}")
         
         data = {
@@ -158,12 +272,13 @@ class ExerciseDBScraper:
                 'url': self.BASE_URL,
                 'total_exercises': len(exercises),
                 'categories': categories,
-                'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
+                'scraped_at': now.strftime('%Y-%m-%d %H:%M:%S')
             },
             'exercises': exercises
         }
         
-        filepath = self.save_data(data)
+        filepath = self.save_data(data, generate_filename('exercisedb_raw', 'ndjson', now))
+        self.save_etag()
         self.logger.info("ExerciseDB scraping completed successfully")
         return filepath
 
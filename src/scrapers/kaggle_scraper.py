@@ -7,23 +7,88 @@ Required configuration:
 2. Get your API token from https://www.kaggle.com/account
 3. Place kaggle.json file in ~/.kaggle/ (Mac/Linux) or %USERPROFILE%\.kaggle\ (Windows)
 
-This scraper uses Kaggle CLI to download datasets
+This scraper uses the Kaggle Python API in-process when available,
+and falls back to the Kaggle CLI otherwise
 """
 
 import subprocess
 import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from config.settings import RAW_DATA_DIR
 from src.utils.logger import setup_logger
 
+# Written once a dataset is fully extracted, a folder without it is incomplete
+_COMPLETE_MARKER = '.complete'
+
+
+@lru_cache(maxsize=1)
+def _get_kaggle_api():
+    """
+    Authenticated Kaggle API client shared by every scraper in the process
+    
+    Importing the kaggle package builds and authenticates a module-level
+    client, which is reused as-is so credentials are read only once.
+    Whether downloads also share HTTP connections depends on the kaggle
+    version (recent clients open a new session per call).
+    
+    Raises:
+        ImportError: If the kaggle package is not installed
+        Exception: If the credentials are missing or invalid
+    """
+    import kaggle
+    
+    return kaggle.api
+
+
+@lru_cache(maxsize=1)
+def _has_kaggle_cli() -> bool:
+    """Whether the kaggle executable is on PATH, looked up once per process"""
+    return shutil.which('kaggle') is not None
+
+
+def _extract_zip(archive_path: Path, output_dir: Path) -> None:
+    """
+    Extract a downloaded archive into output_dir, then delete it
+    
+    Members are copied through 1 MiB buffers so large files never sit
+    in memory at once.
+    
+    Args:
+        archive_path: Path to the zip archive
+        output_dir: Destination folder
+        
+    Raises:
+        ValueError: If an entry would be written outside output_dir
+    """
+    root = output_dir.resolve()
+    
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            target = (root / info.filename).resolve()
+            if root not in target.parents:
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+            
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info) as src, open(target, 'wb', buffering=1 << 20) as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+    
+    archive_path.unlink()
+
 
 class KaggleDatasetScraper:
     """
     Class to automatically download datasets from Kaggle
     
     Features:
-    - Uses Kaggle CLI (official command-line tool)
+    - Uses the official Kaggle API client, or the Kaggle CLI as fallback
     - Downloads and unzips files automatically
     - Organizes datasets in subfolders
     
@@ -33,12 +98,41 @@ class KaggleDatasetScraper:
     3. File must be in: ~/.kaggle/kaggle.json
     """
     
+    # Kaggle identifiers of the datasets used by the project
+    SLUGS = {
+        'nutrition': 'adilshamim8/daily-food-and-nutrition-dataset',
+        'diet_recommendations': 'ziya07/diet-recommendations-dataset',
+        'gym_members': 'valakhorasani/gym-members-exercise-dataset',
+        'fitness_tracker': 'nadeemajeedch/fitness-tracker-dataset'
+    }
+    
     def __init__(self):
         """
         Initialize scraper and verify configuration
+        
+        Authenticates the Kaggle API client once; every download then
+        reuses it instead of starting a CLI process.
         """
         self.logger = setup_logger(self.__class__.__name__)
-        self.check_kaggle_cli()
+        self.api = self.load_kaggle_api()
+        if self.api is None:
+            self.check_kaggle_cli()
+    
+    def load_kaggle_api(self):
+        """
+        Import and authenticate the Kaggle API client
+        
+        Returns:
+            KaggleApi: Authenticated client
+            None: If the kaggle package is missing or authentication fails
+        """
+        try:
+            return _get_kaggle_api()
+        except ImportError:
+            return None
+        except Exception as e:
+            self.logger.warning("Kaggle API authentication failed, using CLI: %s", e)
+            return None
     
     def check_kaggle_cli(self) -> bool:
         """
@@ -47,14 +141,19 @@ class KaggleDatasetScraper:
         Returns:
             bool: True if kaggle CLI is found, False otherwise
         """
-        if not shutil.which('kaggle'):
+        if not _has_kaggle_cli():
             self.logger.warning("Kaggle CLI not found. Install with: pip install kaggle")
             return False
         return True
     
-    def download_dataset(self, dataset_slug: str, output_dir: Optional[Path] = None) -> Optional[Path]:
+    def download_dataset(
+        self,
+        dataset_slug: str,
+        output_dir: Optional[Path] = None,
+        force: bool = False
+    ) -> Optional[Path]:
         """
-        Download dataset from Kaggle using command line
+        Download dataset from Kaggle using the API client (or command line)
         
         Dataset slug is unique identifier on Kaggle.
         Found in URL: kaggle.com/datasets/USERNAME/DATASET-NAME
@@ -62,6 +161,7 @@ class KaggleDatasetScraper:
         Args:
             dataset_slug: Kaggle identifier (format: 'username/dataset-name')
             output_dir: Destination folder (created automatically if not exists)
+            force: Download even if a previous run already extracted the dataset
             
         Returns:
             Path: Path to folder containing downloaded files
@@ -70,74 +170,116 @@ class KaggleDatasetScraper:
         Example:
             download_dataset('adilshamim8/daily-food-and-nutrition-dataset')
         """
+        dataset_name = dataset_slug.split('/')[-1]
         if output_dir is None:
-            dataset_name = dataset_slug.split('/')[-1]
             output_dir = RAW_DATA_DIR / 'kaggle' / dataset_name
         
+        # A previous run fully extracted this dataset, skip the download entirely
+        marker = output_dir / _COMPLETE_MARKER
+        if not force and marker.is_file():
+            self.logger.info("Cache hit: %s", output_dir)
+            return output_dir
+        
         output_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Downloading Kaggle dataset: {dataset_slug}")
+        marker.unlink(missing_ok=True)
+        self.logger.info("Downloading Kaggle dataset: %s", dataset_slug)
         
-        try:
-            result = subprocess.run(
-                ['kaggle', 'datasets', 'download', '-d', dataset_slug, '-p', str(output_dir), '--unzip'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            self.logger.info(f"Download successful to {output_dir}")
-            self.logger.debug(result.stdout)
-            return output_dir
+        # Archives are downloaded as-is and extracted by _extract_zip
+        if self.api is not None:
+            try:
+                self.api.dataset_download_files(dataset_slug, path=str(output_dir), unzip=False, quiet=True)
+            except Exception as e:
+                self.logger.error("Download failed: %s", e)
+                return None
+        else:
+            try:
+                # stderr is forwarded line by line while the download runs, so the
+                # pipe never fills up and the CLI never blocks on it
+                with subprocess.Popen(
+                    ['kaggle', 'datasets', 'download', '-d', dataset_slug, '-p', str(output_dir)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    close_fds=True
+                ) as process:
+                    # Read as bytes so \r is not turned into a line break: progress bars
+                    # redraw in place with \r, and only the final state of each line is logged
+                    for line in process.stderr:
+                        last = line.rstrip(b'\r\n').rsplit(b'\r', 1)[-1]
+                        if last:
+                            self.logger.info("[kaggle] %s", last.decode('utf-8', 'replace'))
+            except FileNotFoundError:
+                self.logger.error("Kaggle CLI not found. Install with: pip install kaggle")
+                return None
             
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Download failed: {e.stderr}")
-            return None
-        except FileNotFoundError:
-            self.logger.error("Kaggle CLI not found. Install with: pip install kaggle")
+            if process.returncode:
+                self.logger.error("Download failed: kaggle exited with status %d", process.returncode)
+                return None
+        
+        try:
+            _extract_zip(output_dir / f'{dataset_name}.zip', output_dir)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            self.logger.error("Extraction failed: %s", e)
             return None
+        
+        marker.touch()
+        self.logger.info("Download successful to %s", output_dir)
+        return output_dir
     
-    def download_nutrition_dataset(self) -> Optional[Path]:
+    def download_nutrition_dataset(self, force: bool = False) -> Optional[Path]:
         """
         Download Daily Food & Nutrition Dataset
         """
-        return self.download_dataset('adilshamim8/daily-food-and-nutrition-dataset')
+        return self.download_dataset(self.SLUGS['nutrition'], force=force)
     
-    def download_diet_recommendations_dataset(self) -> Optional[Path]:
+    def download_diet_recommendations_dataset(self, force: bool = False) -> Optional[Path]:
         """
         Download Diet Recommendations Dataset
         """
-        return self.download_dataset('ziya07/diet-recommendations-dataset')
+        return self.download_dataset(self.SLUGS['diet_recommendations'], force=force)
     
-    def download_gym_members_dataset(self) -> Optional[Path]:
+    def download_gym_members_dataset(self, force: bool = False) -> Optional[Path]:
         """
         Download Gym Members Exercise Dataset
         """
-        return self.download_dataset('valakhorasani/gym-members-exercise-dataset')
+        return self.download_dataset(self.SLUGS['gym_members'], force=force)
     
-    def download_fitness_tracker_dataset(self) -> Optional[Path]:
+    def download_fitness_tracker_dataset(self, force: bool = False) -> Optional[Path]:
         """
         Download Fitness Tracker Dataset
         """
-        return self.download_dataset('nadeemajeedch/fitness-tracker-dataset')
+        return self.download_dataset(self.SLUGS['fitness_tracker'], force=force)
     
-    def download_all_datasets(self) -> Dict[str, Optional[Path]]:
+    def download_all_datasets(self, force: bool = False) -> Dict[str, Optional[Path]]:
         """
         Download all required datasets for the project
         
+        Downloads run concurrently since each one mostly waits on the
+        network (at most one per dataset, which keeps within Kaggle rate
+        limits). They get their own short-lived executor: this method
+        itself runs on the shared scraper pool from run_scraping, and
+        blocking one of its workers on tasks queued to the same pool
+        could deadlock it.
+        
+        Args:
+            force: Download even datasets already present locally
+        
         Returns:
             Dictionary with dataset names and their paths
         """
         self.logger.info("Starting download of all Kaggle datasets")
         
-        datasets = {
-            'nutrition': self.download_nutrition_dataset(),
-            'diet_recommendations': self.download_diet_recommendations_dataset(),
-            'gym_members': self.download_gym_members_dataset(),
-            'fitness_tracker': self.download_fitness_tracker_dataset()
-        }
+        with ThreadPoolExecutor(max_workers=len(self.SLUGS), thread_name_prefix='kaggle') as executor:
+            futures = {
+                name: executor.submit(self.download_dataset, slug, force=force)
+                for name, slug in self.SLUGS.items()
+            }
+            
+            # Collected in SLUGS order so the summary is stable across runs
+            datasets = {name: future.result() for name, future in futures.items()}
         
         successful = sum(1 for path in datasets.values() if path is not None)
-        self.logger.info(f"Downloaded {successful}/{len(datasets)} datasets successfully")
+        self.logger.info("Downloaded %s/%s datasets successfully", successful, len(datasets))
         
         return datasets
 
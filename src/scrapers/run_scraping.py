@@ -1,5 +1,5 @@
 """
-Main script to run all scrapers sequentially
+Main script to run all scrapers concurrently
 
 This file orchestrates the complete data collection process:
 1. Download exercises from ExerciseDB (GitHub)
@@ -13,17 +13,17 @@ from pathlib import Path
 from src.scrapers.exercisedb_scraper import ExerciseDBScraper
 from src.scrapers.kaggle_scraper import KaggleDatasetScraper
 from src.utils.logger import setup_logger
+from src.scrapers._pool import get_pool
 
 
 def main():
     """
-    Main function: run all scrapers in order
+    Main function: run all scrapers concurrently
     
     Process:
     1. Initialize logging system
-    2. Execute ExerciseDB scraper
-    3. Execute Kaggle downloads
-    4. Display final summary
+    2. Execute ExerciseDB scraper and Kaggle downloads side by side
+    3. Display final summary
     """
     logger = setup_logger("ScrapingPipeline")
     
@@ -33,19 +33,23 @@ def main():
     
     results = {}
     
+    # GitHub and Kaggle are independent endpoints, both mostly waiting on I/O
+    pool = get_pool()
+    
     logger.info("\n[1/2] Downloading exercises from ExerciseDB (GitHub)...")
+    exercisedb_future = pool.submit(lambda: ExerciseDBScraper().run())
+    
+    logger.info("\n[2/2] Downloading Kaggle datasets...")
+    kaggle_future = pool.submit(lambda: KaggleDatasetScraper().download_all_datasets())
+    
     try:
-        exercisedb_scraper = ExerciseDBScraper()
-        results['exercisedb'] = exercisedb_scraper.run()
+        results['exercisedb'] = exercisedb_future.result()
     except Exception as e:
         logger.error(f"ExerciseDB scraping failed: {e}")
         results['exercisedb'] = None
     
-    logger.info("\n[2/2] Downloading Kaggle datasets...")
     try:
-        kaggle_scraper = KaggleDatasetScraper()
-        kaggle_results = kaggle_scraper.download_all_datasets()
-        results.update(kaggle_results)
+        results.update(kaggle_future.result())
     except Exception as e:
         logger.error(f"Kaggle downloads failed: {e}")
     
@@ -53,11 +57,14 @@ def main():
     logger.info("Scraping Pipeline Summary")
     logger.info("=" * 60)
     
+    # One log record for the whole summary
+    lines = []
     for name, result in results.items():
         status = "✅ SUCCESS" if result else "❌ FAILED"
-        logger.info(f"{name}: {status}")
+        lines.append(f"{name}: {status}")
         if result:
-            logger.info(f"  → {result}")
+            lines.append(f"  → {result}")
+    logger.info("\n".join(lines))
     
     successful = sum(1 for r in results.values() if r is not None)
     total = len(results)
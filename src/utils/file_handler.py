@@ -2,11 +2,37 @@
 File handling utilities for saving data
 """
 
+import fnmatch
 import json
+import mmap
+import os
+import re
 import pandas as pd
 from pathlib import Path
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional, Iterable, Iterator, Pattern, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON codec
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional multithreaded CSV reader/writer
+    pa = None
+
+
+def _json_default(obj):
+    """Serialize values the JSON encoders do not handle natively"""
+    if obj is pd.NA:
+        return None
+    if hasattr(obj, 'item'):
+        # numpy scalars
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def save_to_json(data: Union[List, Dict], filepath: Path, indent: int = 2) -> None:
@@ -20,8 +46,99 @@ def save_to_json(data: Union[List, Dict], filepath: Path, indent: int = 2) -> No
     """
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
+    if orjson is not None:
+        # orjson only supports two-space indentation
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        filepath.write_bytes(orjson.dumps(data, default=_json_default, option=option))
+        return
+    
+    # Large buffer so the encoder's many small chunks reach disk in few writes
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, default=_json_default, check_circular=False)
+
+
+def save_records_to_json(
+    metadata: Dict,
+    df: pd.DataFrame,
+    records_key: str,
+    filepath: Path
+) -> None:
+    """
+    Save metadata and DataFrame rows as one JSON object
+    
+    The rows are streamed straight from pandas' C encoder instead of
+    being materialized as Python dicts first.
+    
+    Args:
+        metadata: Metadata stored under the 'metadata' key
+        df: Pandas DataFrame whose rows are stored as records
+        records_key: Key holding the list of records
+        filepath: Path to save the file
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    if orjson is not None:
+        metadata_json = orjson.dumps(
+            metadata,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    else:
+        metadata_json = json.dumps(metadata, ensure_ascii=False, default=_json_default)
+    
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.write(f'{{"metadata": {metadata_json}, {json.dumps(records_key)}: ')
+        df.to_json(f, orient='records', force_ascii=False, double_precision=15)
+        f.write('}')
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one object as a compact JSON line"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, ensure_ascii=False, default=_json_default) + '\n').encode('utf-8')
+
+
+def save_to_ndjson(header: Dict, records: Iterable[Dict], filepath: Path) -> None:
+    """
+    Save a header object followed by one record per line (NDJSON)
+    
+    Records are written as they are consumed, so any iterable works
+    and nothing is buffered beyond the current line.
+    
+    Args:
+        header: Object written on the first line (e.g. metadata)
+        records: Records written on the following lines
+        filepath: Path to save the file
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(filepath, 'wb') as f:
+        f.write(_dumps_line(header))
+        for record in records:
+            f.write(_dumps_line(record))
+
+
+def iter_ndjson(filepath: Path) -> Iterator[Union[List, Dict]]:
+    """
+    Lazily parse an NDJSON file, one object per line
+    
+    Args:
+        filepath: Path to NDJSON file
+        
+    Yields:
+        Parsed object of each non-empty line
+    """
+    with open(filepath, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield parse_json(line)
 
 
 def save_to_csv(df: pd.DataFrame, filepath: Path) -> None:
@@ -33,33 +150,161 @@ def save_to_csv(df: pd.DataFrame, filepath: Path) -> None:
         filepath: Path to save the file
     """
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(filepath, index=False, encoding='utf-8')
+    
+    if pa is None:
+        # Write in chunks so the whole rendered CSV is never held in memory
+        df.to_csv(filepath, index=False, encoding='utf-8', chunksize=50000)
+        return
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # The CSV writer only accepts plain value columns, so decode categoricals
+    table = pa.table({
+        name: column.cast(column.type.value_type) if pa.types.is_dictionary(column.type) else column
+        for name, column in zip(table.column_names, table.columns)
+    })
+    pacsv.write_csv(
+        table,
+        str(filepath),
+        write_options=pacsv.WriteOptions(include_header=True)
+    )
+
+
+def save_to_parquet(df: pd.DataFrame, filepath: Path, compression: str = 'zstd') -> None:
+    """
+    Save DataFrame to Parquet file
+    
+    List columns are stored natively and low-cardinality columns
+    are dictionary-encoded.
+    
+    Args:
+        df: Pandas DataFrame to save
+        filepath: Path to save the file
+        compression: Parquet compression codec
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(
+        filepath,
+        engine='pyarrow',
+        compression=compression,
+        index=False,
+        use_dictionary=True
+    )
+
+
+def load_from_csv(filepath: Path) -> pd.DataFrame:
+    """
+    Load DataFrame from CSV file
+    
+    Uses the multithreaded pyarrow parser and Arrow-backed dtypes
+    when pyarrow is installed.
+    
+    Args:
+        filepath: Path to CSV file
+        
+    Returns:
+        Loaded DataFrame
+    """
+    if pa is None:
+        return pd.read_csv(filepath)
+    return pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
+
+
+def parse_json(raw: Union[bytes, str]) -> Union[List, Dict]:
+    """
+    Parse a JSON document, with orjson when available
+    
+    Args:
+        raw: JSON document as bytes or str
+        
+    Returns:
+        Parsed data
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def load_from_json(filepath: Path) -> Union[List, Dict]:
     """
     Load data from JSON file
     
+    With orjson the document is parsed straight from a memory map of the
+    file, so its bytes are never copied into a Python buffer that would
+    stay alive next to the parsed result.
+    
     Args:
         filepath: Path to JSON file
         
     Returns:
         Loaded data
+        
+    Raises:
+        ValueError: If the file is empty or not valid JSON
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        
+        # The view must be released before the map can be closed
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
 
-def generate_filename(base_name: str, extension: str = 'json') -> str:
+def generate_filename(
+    base_name: str,
+    extension: str = 'json',
+    now: Optional[datetime] = None
+) -> str:
     """
     Generate filename with timestamp
     
     Args:
         base_name: Base name for the file
         extension: File extension (without dot)
+        now: Timestamp to use (defaults to now)
         
     Returns:
         Filename with timestamp
     """
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = (now or datetime.now()).strftime('%Y%m%d_%H%M%S')
     return f"{base_name}_{timestamp}.{extension}"
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Pattern:
+    """Compile glob patterns into a single case-sensitive regex"""
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+
+def find_latest_file(dir_path: Path, *patterns: str) -> Optional[Path]:
+    """
+    Find the most recently modified file matching any of the patterns
+    
+    Uses os.scandir so each entry is stat'ed once and no Path
+    object is built for non-matching entries. Entries are visited in
+    directory order; ties on mtime go to the higher inode number.
+    
+    Args:
+        dir_path: Directory to search
+        patterns: Glob-style filename patterns
+        
+    Returns:
+        Path of the newest matching file, or None if there is none
+    """
+    if not dir_path.is_dir():
+        return None
+    
+    match = _compile_patterns(patterns).match
+    best_key = None
+    best_path = None
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if match(entry.name) and entry.is_file():
+                key = (entry.stat().st_mtime, entry.inode())
+                if best_key is None or key > best_key:
+                    best_key, best_path = key, entry.path
+    
+    return Path(best_path) if best_path is not None else None
@@ -4,27 +4,53 @@ Logger configuration for ETL pipeline
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from config.settings import LOG_LEVEL, LOG_FILE
 
-def setup_logger(name: str = "ETL") -> logging.Logger:
+# Stands for LOG_FILE, looked up at call time so it can be redirected (e.g. in tests)
+_DEFAULT_LOG_FILE = object()
+
+@lru_cache(maxsize=None)
+def setup_logger(name: str = "ETL", log_file: Optional[Path] = _DEFAULT_LOG_FILE) -> logging.Logger:
     """
     Configure and return a logger instance
     
+    Memoized per name, so repeated calls return the same logger
+    without attaching duplicate handlers.
+    
     Args:
         name: Logger name
+        log_file: Log file path (defaults to LOG_FILE), None to discard all records
         
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    
+    # Already configured (e.g. by another module or before a cache clear)
+    if logger.handlers:
+        return logger
+    
     logger.setLevel(getattr(logging, LOG_LEVEL))
+    # Handlers are attached here, the root logger would only duplicate records
+    logger.propagate = False
+    
+    if log_file is _DEFAULT_LOG_FILE:
+        log_file = LOG_FILE
+    
+    if log_file is None:
+        logger.addHandler(logging.NullHandler())
+        return logger
     
     # Create logs directory if it doesn't exist
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # File handler
-    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+    # File handler, opened lazily on first record. Plain append mode: every
+    # logger (and every pool worker process) holds its own handle on the same
+    # file, and independent rotations would rename it under the others
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
     file_handler.setLevel(logging.DEBUG)
     
     # Console handler
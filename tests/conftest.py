@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from src.utils.logger import setup_logger
+
+
+@pytest.fixture(autouse=True)
+def _silence_logging(monkeypatch):
+    """Fixture to route every logger built during a test to a NullHandler instead of the log file"""
+    monkeypatch.setattr('src.utils.logger.LOG_FILE', None)
+    setup_logger.cache_clear()
+    yield
+    setup_logger.cache_clear()
@@ -0,0 +1,134 @@
+"""
+Unit tests for ExerciseDBScraper module
+
+Tests the categories cache and the conditional download
+of the exercise list.
+"""
+
+import json
+from unittest import mock
+
+import pytest
+from src.scrapers.exercisedb_scraper import ExerciseDBScraper
+from src.utils.file_handler import save_to_json, save_to_ndjson, load_from_json
+
+
+class _FakeResponse:
+    """Minimal streamed response returned by the mocked session"""
+    
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    def iter_content(self, chunk_size=1):
+        yield self.body
+
+
+@pytest.fixture
+def sample_exercises():
+    """Fixture to create downloaded exercise data"""
+    return [
+        {"id": "push_up_1", "equipment": "body only", "category": "strength", "primaryMuscles": ["chest", "triceps"]},
+        {"id": "barbell_curl_1", "equipment": "barbell", "category": "strength", "primaryMuscles": ["biceps"]}
+    ]
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Fixture to create a scraper writing under tmp_path"""
+    monkeypatch.setattr('src.scrapers.exercisedb_scraper.RAW_DATA_DIR', tmp_path)
+    monkeypatch.setattr(ExerciseDBScraper, 'ETAG_FILE', tmp_path / '.exercisedb.etag')
+    monkeypatch.setattr(ExerciseDBScraper, 'CATEGORIES_CACHE_DIR', tmp_path / '.cat_cache')
+    return ExerciseDBScraper()
+
+
+@pytest.fixture
+def previous_file(tmp_path):
+    """Fixture to create a raw file from a previous download"""
+    filepath = tmp_path / 'exercisedb_raw_20260101_000000.ndjson'
+    save_to_ndjson({'source': 'ExerciseDB'}, [], filepath)
+    return filepath
+
+
+def test_fetch_exercises_stores_new_etag(scraper, sample_exercises, previous_file, tmp_path):
+    """Test un téléchargement complet (200) qui renvoie un nouvel ETag"""
+    scraper.etag = '"old"'
+    scraper.session.get = mock.Mock(return_value=_FakeResponse(
+        200, json.dumps(sample_exercises).encode('utf-8'), {'ETag': '"new"'}
+    ))
+    
+    exercises = scraper.fetch_exercises()
+    
+    assert exercises == sample_exercises
+    assert scraper.session.get.call_args.kwargs['headers'] == {'If-None-Match': '"old"'}
+    assert scraper.etag == '"new"'
+    assert scraper.content_hash is not None
+    assert scraper.unchanged_file is None
+    assert not (tmp_path / '.exercisedb.tmp').exists()
+
+
+def test_fetch_exercises_not_modified(scraper, previous_file):
+    """Test qu'une réponse 304 réutilise le dernier fichier téléchargé"""
+    scraper.etag = '"old"'
+    scraper.session.get = mock.Mock(return_value=_FakeResponse(304))
+    
+    assert scraper.fetch_exercises() is None
+    assert scraper.unchanged_file == previous_file
+    assert scraper.content_hash is None
+
+
+def test_fetch_exercises_without_previous_file(scraper, sample_exercises):
+    """Test que l'en-tête If-None-Match n'est pas envoyé sans fichier précédent"""
+    scraper.etag = '"old"'
+    scraper.session.get = mock.Mock(return_value=_FakeResponse(
+        200, json.dumps(sample_exercises).encode('utf-8'), {'ETag': '"new"'}
+    ))
+    
+    assert scraper.fetch_exercises() == sample_exercises
+    assert scraper.session.get.call_args.kwargs['headers'] == {}
+
+
+def test_get_categories_cache_hit(scraper, sample_exercises):
+    """Test que les catégories en cache sont réutilisées pour le même contenu"""
+    scraper.content_hash = 'abc'
+    cached = {'bodyParts': ['cached'], 'equipment': [], 'targets': []}
+    save_to_json(cached, scraper.CATEGORIES_CACHE_DIR / 'abc.json')
+    
+    assert scraper.get_categories(sample_exercises) == cached
+
+
+def test_get_categories_corrupt_cache(scraper, sample_exercises):
+    """Test qu'un cache tronqué est ignoré puis réécrit"""
+    scraper.content_hash = 'abc'
+    cache_path = scraper.CATEGORIES_CACHE_DIR / 'abc.json'
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text('{"bodyParts": ["ch')
+    
+    categories = scraper.get_categories(sample_exercises)
+    
+    assert categories == {
+        'bodyParts': ['biceps', 'chest', 'triceps'],
+        'equipment': ['barbell', 'body only'],
+        'targets': ['strength']
+    }
+    assert load_from_json(cache_path) == categories
+
+
+def test_get_categories_keeps_only_current_entry(scraper, sample_exercises):
+    """Test que seules les catégories du contenu actuel restent en cache"""
+    save_to_json({'bodyParts': [], 'equipment': [], 'targets': []}, scraper.CATEGORIES_CACHE_DIR / 'old.json')
+    scraper.content_hash = 'abc'
+    
+    scraper.get_categories(sample_exercises)
+    
+    assert [p.name for p in scraper.CATEGORIES_CACHE_DIR.iterdir()] == ['abc.json']
@@ -0,0 +1,50 @@
+"""
+Unit tests for file_handler module
+
+Tests the raw NDJSON format and the raw file lookup
+used by scrapers and processors.
+"""
+
+import os
+from src.utils.file_handler import save_to_ndjson, iter_ndjson, save_to_json, find_latest_file
+
+
+def test_ndjson_round_trip(tmp_path):
+    """Test l'écriture puis la relecture d'un fichier NDJSON"""
+    header = {'source': 'ExerciseDB', 'total_exercises': 2}
+    records = [
+        {'id': 'push_up_1', 'name': 'Push-Up', 'primaryMuscles': ['chest', 'triceps']},
+        {'id': 'barbell_curl_1', 'name': 'Barbell Curl', 'primaryMuscles': ['biceps']}
+    ]
+    filepath = tmp_path / 'exercisedb_raw_20260101_000000.ndjson'
+    
+    save_to_ndjson(header, iter(records), filepath)
+    
+    # Une ligne pour l'en-tête puis une ligne par enregistrement
+    assert len(filepath.read_bytes().splitlines()) == 3
+    
+    lines = list(iter_ndjson(filepath))
+    assert lines[0] == header
+    assert lines[1:] == records
+
+
+def test_find_latest_file_prefers_newer_ndjson(tmp_path):
+    """Test que le fichier NDJSON récent est choisi plutôt que l'ancien JSON"""
+    legacy = tmp_path / 'exercisedb_raw_20260101_000000.json'
+    current = tmp_path / 'exercisedb_raw_20260102_000000.ndjson'
+    save_to_json({'metadata': {}, 'exercises': []}, legacy)
+    save_to_ndjson({}, [], current)
+    (tmp_path / 'unrelated.ndjson').write_text('{}\n')
+    
+    os.utime(legacy, (1_000_000, 1_000_000))
+    os.utime(current, (2_000_000, 2_000_000))
+    os.utime(tmp_path / 'unrelated.ndjson', (3_000_000, 3_000_000))
+    
+    latest = find_latest_file(tmp_path, 'exercisedb_raw_*.ndjson', 'exercisedb_raw_*.json')
+    
+    assert latest == current
+
+
+def test_find_latest_file_missing_directory(tmp_path):
+    """Test qu'un dossier inexistant ne lève pas d'erreur"""
+    assert find_latest_file(tmp_path / 'missing', '*.ndjson') is None
@@ -0,0 +1,163 @@
+"""
+Unit tests for GymMembersProcessor module
+
+Tests the cleaning and enrichment functions
+of the gym members processor.
+"""
+
+import pytest
+import pandas as pd
+from pandas.testing import assert_series_equal
+from src.processors.gym_members_processor import GymMembersProcessor
+from src.utils.file_handler import load_from_json
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    """Fixture to write a small CSV with the Kaggle column layout"""
+    filepath = tmp_path / 'gym_members_exercise_tracking.csv'
+    filepath.write_text(
+        "Age,Gender,Weight (kg),Height (m),Max_BPM,Avg_BPM,Session_Duration (hours),"
+        "Calories_Burned,Workout_Type,Workout_Frequency (days/week),Experience_Level,BMI\n"
+        "30,Male,80.0,1.80,180,140,1.0,500,Cardio,3,2,24.69\n"
+        "45,Female,60.0,1.65,170,130,1.5,600,Yoga,4,3,22.04\n"
+        "10,Male,35.0,1.30,190,150,0.5,200,HIIT,2,1,20.71\n",  # Âge hors limites
+        encoding='utf-8'
+    )
+    return filepath
+
+
+@pytest.fixture
+def processor():
+    """Fixture to create processor instance"""
+    return GymMembersProcessor()
+
+
+def test_bmi_category_bin_edges(processor):
+    """Test que chaque borne inférieure de BMI appartient à la catégorie supérieure"""
+    df = pd.DataFrame({'bmi': [18.4, 18.5, 24.9, 25.0, 29.9, 30.0]})
+    
+    enriched = processor.enrich_data(df)
+    
+    assert list(enriched['bmi_category']) == [
+        'underweight', 'normal', 'normal', 'overweight', 'overweight', 'obese'
+    ]
+
+
+def test_age_group_bin_edges(processor):
+    """Test les tranches d'âge à chaque borne"""
+    df = pd.DataFrame({'age': [24, 25, 34, 35, 44, 45, 54, 55]})
+    
+    enriched = processor.enrich_data(df)
+    
+    assert list(enriched['age_group']) == [
+        '18-24', '25-34', '25-34', '35-44', '35-44', '45-54', '45-54', '55+'
+    ]
+
+
+def test_body_fat_category_bin_edges_male(processor):
+    """Test les catégories de masse grasse masculines à chaque borne"""
+    df = pd.DataFrame({
+        'body_fat_%': [5.9, 6.0, 14.0, 18.0, 25.0],
+        'gender': ['M'] * 5
+    })
+    
+    enriched = processor.enrich_data(df)
+    
+    assert list(enriched['body_fat_category']) == ['essential', 'athletic', 'fit', 'average', 'obese']
+
+
+def test_body_fat_category_bin_edges_female(processor):
+    """Test les catégories de masse grasse féminines à chaque borne"""
+    df = pd.DataFrame({
+        'body_fat_%': [13.9, 14.0, 21.0, 25.0, 32.0],
+        'gender': ['F'] * 5
+    })
+    
+    enriched = processor.enrich_data(df)
+    
+    assert list(enriched['body_fat_category']) == ['essential', 'athletic', 'fit', 'average', 'obese']
+
+
+def test_body_fat_category_unknown_gender(processor):
+    """Test qu'un genre manquant ou inconnu utilise les seuils féminins"""
+    df = pd.DataFrame({
+        'body_fat_%': [14.0, 14.0, 14.0, 14.0],
+        'gender': pd.Series(['M', 'F', pd.NA, 'X'], dtype='string')
+    })
+    
+    enriched = processor.enrich_data(df)
+    
+    # 14 % : 'fit' pour un homme, 'athletic' avec le barème féminin
+    assert list(enriched['body_fat_category']) == ['fit', 'athletic', 'athletic', 'athletic']
+
+
+def test_experience_score_mixed_levels(processor):
+    """Test le score d'expérience pour des niveaux entiers, textuels et manquants"""
+    df = pd.DataFrame({'experience_level': [1, '2', 'Expert', None, '7']})
+    
+    df = processor.clean_text_fields(df)
+    enriched = processor.enrich_data(df)
+    
+    assert_series_equal(
+        enriched['experience_score'],
+        pd.Series([1, 2, 3, None, None], name='experience_score', dtype='Int8')
+    )
+    assert list(enriched['experience_level'][:3]) == ['beginner', 'intermediate', 'expert']
+    assert enriched['experience_level'][3:].isna().all()
+
+
+def test_experience_score_nullable_integer_levels(processor):
+    """Test le score d'expérience pour une colonne entière avec valeurs manquantes"""
+    df = pd.DataFrame({'experience_level': pd.Series([3, pd.NA, 1], dtype='Int64')})
+    
+    df = processor.clean_text_fields(df)
+    enriched = processor.enrich_data(df)
+    
+    assert_series_equal(
+        enriched['experience_score'],
+        pd.Series([3, None, 1], name='experience_score', dtype='Int8')
+    )
+
+
+def test_csv_load_enrich_export(processor, raw_csv, tmp_path, monkeypatch):
+    """Test le pipeline complet d'un CSV jusqu'à l'export JSON et CSV"""
+    monkeypatch.setattr('src.processors.gym_members_processor.PROCESSED_DATA_DIR', tmp_path)
+    
+    df = processor.load_raw_data(raw_csv)
+    df = processor.validate_data(df)
+    df = processor.clean_text_fields(df)
+    df = processor.enrich_data(df)
+    df = processor.remove_duplicates(df)
+    df = processor.add_metadata_columns(df)
+    
+    assert processor.stats.total_members == 3
+    assert processor.stats.valid_members == 2
+    
+    # Types produits par l'enrichissement, quel que soit le backend de lecture
+    assert isinstance(df['gender'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['bmi_category'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['age_group'].dtype, pd.CategoricalDtype)
+    assert df['experience_level'].cat.ordered
+    assert df['experience_score'].dtype == 'Int8'
+    assert df['fitness_score'].dtype == 'float64'
+    
+    assert list(df['gender']) == ['M', 'F']
+    assert list(df['bmi_category']) == ['normal', 'normal']
+    assert list(df['age_group']) == ['25-34', '45-54']
+    assert list(df['experience_level']) == ['intermediate', 'expert']
+    assert list(df['experience_score']) == [2, 3]
+    assert list(df['fitness_score']) == [196.36, 235.45]
+    assert list(df['heart_rate_reserve']) == [40, 40]
+    assert list(df['calorie_burn_rate']) == [500.0, 400.0]
+    
+    exported = processor.export_processed_data(df, output_format='both')
+    
+    members = load_from_json(exported['json'])['members']
+    assert [m['experience_score'] for m in members] == [2, 3]
+    assert [m['bmi_category'] for m in members] == ['normal', 'normal']
+    assert [m['workout_type'] for m in members] == ['cardio', 'yoga']
+    
+    exported_csv = pd.read_csv(exported['csv'])
+    assert list(exported_csv['experience_level']) == ['intermediate', 'expert']
+    assert list(exported_csv['fitness_score']) == [196.36, 235.45]
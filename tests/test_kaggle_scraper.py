@@ -0,0 +1,112 @@
+"""
+Unit tests for kaggle_scraper module
+
+Tests the extraction of downloaded dataset archives
+and the download cache.
+"""
+
+import zipfile
+from unittest import mock
+
+import pytest
+from src.scrapers.kaggle_scraper import KaggleDatasetScraper, _extract_zip
+
+
+def _write_dataset_zip(dataset_slug, path, **kwargs):
+    """Stand-in for KaggleApi.dataset_download_files writing a valid archive"""
+    archive_path = f"{path}/{dataset_slug.split('/')[-1]}.zip"
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('members.csv', 'age\n25\n')
+
+
+def _write_corrupt_zip(dataset_slug, path, **kwargs):
+    """Stand-in for KaggleApi.dataset_download_files writing a broken archive"""
+    with open(f"{path}/{dataset_slug.split('/')[-1]}.zip", 'wb') as f:
+        f.write(b'not a zip archive')
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Fixture to stub the authenticated Kaggle API client"""
+    stub = mock.Mock()
+    monkeypatch.setattr('src.scrapers.kaggle_scraper._get_kaggle_api', lambda: stub)
+    return stub
+
+
+@pytest.fixture
+def scraper(api):
+    """Fixture to create a scraper using the stubbed API"""
+    return KaggleDatasetScraper()
+
+
+def test_extract_zip(tmp_path):
+    """Test l'extraction d'une archive puis sa suppression"""
+    output_dir = tmp_path / 'dataset'
+    output_dir.mkdir()
+    archive_path = output_dir / 'dataset.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('members.csv', 'age,gender\n25,Male\n')
+        archive.writestr('extra/notes.csv', 'note\nok\n')
+    
+    _extract_zip(archive_path, output_dir)
+    
+    assert (output_dir / 'members.csv').read_text() == 'age,gender\n25,Male\n'
+    assert (output_dir / 'extra' / 'notes.csv').read_text() == 'note\nok\n'
+    assert not archive_path.exists()
+
+
+def test_extract_zip_rejects_path_traversal(tmp_path):
+    """Test qu'une entrée sortant du dossier de destination est refusée"""
+    output_dir = tmp_path / 'dataset'
+    output_dir.mkdir()
+    archive_path = output_dir / 'dataset.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('../evil.csv', 'pwned\n')
+    
+    with pytest.raises(ValueError):
+        _extract_zip(archive_path, output_dir)
+    
+    # Rien n'a été écrit hors du dossier de destination
+    assert not (tmp_path / 'evil.csv').exists()
+    assert [p.name for p in tmp_path.iterdir()] == ['dataset']
+
+
+def test_download_dataset_skips_completed_dataset(scraper, api, tmp_path):
+    """Test qu'un dataset déjà extrait n'est pas retéléchargé"""
+    output_dir = tmp_path / 'dataset'
+    output_dir.mkdir()
+    (output_dir / '.complete').touch()
+    
+    assert scraper.download_dataset('user/dataset', output_dir) == output_dir
+    api.dataset_download_files.assert_not_called()
+
+
+def test_download_dataset_force_downloads_again(scraper, api, tmp_path):
+    """Test que force=True retélécharge un dataset déjà extrait"""
+    output_dir = tmp_path / 'dataset'
+    output_dir.mkdir()
+    (output_dir / '.complete').touch()
+    api.dataset_download_files.side_effect = _write_dataset_zip
+    
+    assert scraper.download_dataset('user/dataset', output_dir, force=True) == output_dir
+    
+    api.dataset_download_files.assert_called_once()
+    assert (output_dir / 'members.csv').read_text() == 'age\n25\n'
+    assert (output_dir / '.complete').is_file()
+    assert not (output_dir / 'dataset.zip').exists()
+
+
+def test_download_dataset_failed_extraction_leaves_no_marker(scraper, api, tmp_path):
+    """Test qu'une extraction échouée ne laisse pas de marqueur de complétion"""
+    output_dir = tmp_path / 'dataset'
+    output_dir.mkdir()
+    (output_dir / '.complete').touch()
+    api.dataset_download_files.side_effect = _write_corrupt_zip
+    
+    assert scraper.download_dataset('user/dataset', output_dir, force=True) is None
+    assert not (output_dir / '.complete').exists()
+    
+    # Le dataset incomplet n'est donc pas considéré comme en cache
+    api.dataset_download_files.side_effect = _write_dataset_zip
+    assert scraper.download_dataset('user/dataset', output_dir) == output_dir
+    assert api.dataset_download_files.call_count == 2
@@ -0,0 +1,49 @@
+"""
+Unit tests for run_processing module
+
+Tests the pipeline selection of the processing orchestrator.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from src.processors import run_processing
+
+
+@pytest.fixture
+def pipelines(monkeypatch):
+    """Fixture to stub every processor and run them in threads instead of processes"""
+    monkeypatch.setattr('src.processors.run_processing.ProcessPoolExecutor', ThreadPoolExecutor)
+    stubs = {}
+    for name in run_processing.PIPELINES:
+        stubs[name] = mock.Mock(return_value={'csv': f'{name}.csv'})
+        monkeypatch.setitem(run_processing.PIPELINES, name, stubs[name])
+    return stubs
+
+
+def test_main_runs_all_pipelines(pipelines):
+    """Test que tous les pipelines sont exécutés par défaut"""
+    results = run_processing.main([])
+    
+    assert results == {name: {'csv': f'{name}.csv'} for name in pipelines}
+    for stub in pipelines.values():
+        stub.assert_called_once_with()
+
+
+def test_main_only_runs_selected_pipeline(pipelines):
+    """Test que --only n'exécute que le pipeline demandé"""
+    results = run_processing.main(['--only', 'exercisedb'])
+    
+    assert results == {'exercisedb': {'csv': 'exercisedb.csv'}}
+    pipelines['exercisedb'].assert_called_once_with()
+    pipelines['gym_members'].assert_not_called()
+
+
+def test_main_rejects_unknown_pipeline(pipelines):
+    """Test qu'un nom de pipeline inconnu est refusé avant toute exécution"""
+    with pytest.raises(SystemExit):
+        run_processing.main(['--only', 'exercises'])
+    
+    for stub in pipelines.values():
+        stub.assert_not_called()